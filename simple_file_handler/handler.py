@@ -1,15 +1,98 @@
+import io
 import os
+import mmap
+import codecs
+import errno
+import stat
+import shutil
+import functools
+import itertools
+import importlib
+import time
 import warnings
-import yaml
-import toml
 import json
-import csv
-import pickle
-from typing import (IO, Dict, List, Any, Tuple)
+import math
+from typing import (IO, Dict, List, Any, Tuple, Callable, Iterator)
 from collections.abc import Iterable
 
 from .exceptions import FileError
 
+# Serializer modules (yaml, toml, csv, pickle) are imported lazily, in the methods 
+# that use them, so handlers for plain text files do not pay their import cost.
+
+_SUPPORTED_TYPES_TUPLE: Tuple[str, ...] = (
+    'txt', 'doc', 'docx', 'pdf', 'html', 'htm', 'xml',
+    'js', 'css', 'md', 'json', 'csv', 'yaml', 'yml', 
+    'toml', 'pickle', 'pkl', 'log', 'xht', 'xhtml', 'shtml',
+)
+# Used for membership checks in the read/write paths
+_SUPPORTED_TYPES = frozenset(_SUPPORTED_TYPES_TUPLE)
+
+# Mode characters that are not allowed when reading and writing, respectively
+_WRITE_MODE_CHARS = frozenset('waxWAX')
+_READ_MODE_CHARS = frozenset('rxRX')
+
+# `os.stat` results shared by handlers created with a non-zero `stat_cache_ttl`.
+# Maps a file path to the (monotonic) time of the `stat` call and its result, 
+# which is None if the file did not exist. Ordered from least to most recently stored.
+_stat_cache: Dict[str, Tuple[float, os.stat_result | None]] = {}
+_STAT_CACHE_MAXSIZE = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _import_optional(name: str):
+    """
+    Imports and returns the module `name`, or None if it is not installed.
+
+    Used for the optional C/Rust-backed serializers, which are preferred over the
+    pure-Python implementations whenever they are installed. The result is cached 
+    so a missing module is only searched for once.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _is_utf8(encoding: str) -> bool:
+    """Returns True if `encoding` is a name/alias of the UTF-8 codec (without BOM)."""
+    return codecs.lookup(encoding).name == 'utf-8'
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """
+    Returns True if `obj`, or any value nested in it (in dicts, lists and tuples),
+    is a float that is NaN or infinite.
+    """
+    stack = [obj]
+    # Ids of the containers already walked, so that circular references
+    # (which fail to serialize anyway) do not cause an infinite loop
+    seen = set()
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, (dict, list, tuple)):
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            stack.extend(value.values() if isinstance(value, dict) else value)
+    return False
+
+
+def _create_if_absent(path: str) -> bool:
+    """
+    Atomically creates an empty file at `path` if nothing exists there yet.
+
+    Returns True if the file was created, and False if `path` already exists.
+    """
+    try:
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+    except FileExistsError:
+        return False
+    return True
+
 
 class FileHandler:
     """
@@ -32,13 +115,46 @@ class FileHandler:
     # Output: Hello World!
     ```
     """
+    # Size (in bytes) of the buffer used for the handled file's I/O. A large buffer
+    # lets the many small writes made by serializers (yaml, csv, pickle) coalesce
+    # into fewer system calls. Override on a subclass or instance to tune.
+    BUFFER_SIZE: int = 1 << 20
+    # Minimum size (in bytes) of a JSON file for it to be memory-mapped when read 
+    # with `orjson`. Below this, setting up the mapping costs more than it saves.
+    MMAP_THRESHOLD: int = 64 * 1024
+    # Number of rows formatted at a time (with `csv.writer.writerows`) when writing csv files
+    CSV_BATCH_ROWS: int = 4096
+    # Names of the methods used to read and write file types that need special handling.
+    # Files of other types are read and written as is.
+    _READERS: Dict[str, str] = {
+        'json': '_read_json',
+        'csv': '_read_csv',
+        'yaml': '_read_yaml',
+        'pickle': '_read_pickle',
+        'toml': '_read_toml',
+    }
+    _WRITERS: Dict[str, str] = {
+        'json': '_write_json',
+        'csv': '_write_csv',
+        'yaml': '_write_yaml',
+        'pickle': '_write_pickle',
+        'toml': '_write_toml',
+    }
+    # `newline` argument used when opening files of these types in text mode. 
+    # Files of other types are opened with universal newlines (None).
+    # The csv module handles line endings itself, so translation is disabled for csv files.
+    _NEWLINES: Dict[str, str] = {
+        'csv': '',
+    }
+
     def __init__(
             self, 
             filepath: str, 
             encoding: str = 'utf-8', 
             not_found_ok: bool = True, 
             exists_ok: bool = True, 
-            allow_any: bool = False
+            allow_any: bool = False,
+            stat_cache_ttl: float = 0
         ):
         """
         Creates a FileHandler object for the specified file.
@@ -56,25 +172,37 @@ class FileHandler:
         a `FileExistsError` is raised. Defaults to True.
         :param bool allow_any: Whether to allow reading and writing to any file type. If True, the file type is not checked
         before reading or writing to the file. Defaults to False.
+        :param float stat_cache_ttl: Number of seconds for which the file's metadata (used by `file_exists` 
+        and `file_size`) may be cached, to avoid repeated `stat` calls when polled in a loop. The cache is 
+        invalidated by the handler's own modifications, but not by writes made directly through `file` 
+        or by other processes, which are only seen once the cached result expires. Defaults to 0 (no caching).
         """
         self._file: IO = None
         self.created_file = False
         self.filepath = os.path.abspath(filepath)
         self.encoding = encoding
         self.allow_any = allow_any
+        self.stat_cache_ttl = stat_cache_ttl
         
-        if not os.path.exists(self.filepath):
+        # A single `stat` call tells whether the file exists and whether it is a regular file
+        try:
+            file_stat = os.stat(self.filepath)
+        except FileNotFoundError:
             if not_found_ok is False:
-                raise FileNotFoundError(f"File not found: {self.filepath}")
-            os.makedirs(os.path.dirname(self.filepath), exist_ok=True, mode=0o777)
-            open(self.filepath, 'x').close()
+                raise FileNotFoundError(f"File not found: {self.filepath}") from None
+            try:
+                open(self.filepath, 'x').close()
+            except FileNotFoundError:
+                # Only create the parent directories when they are missing
+                os.makedirs(os.path.dirname(self.filepath), exist_ok=True, mode=0o777)
+                open(self.filepath, 'x').close()
             self.created_file = True
 
         else:
             if exists_ok is False:
                 raise FileExistsError(f"File already exist: {self.filepath}")
-        if not os.path.isfile(self.filepath):
-            raise FileError(f"File not created: {self.filepath}. Check if the path points to a file.")
+            if not stat.S_ISREG(file_stat.st_mode):
+                raise FileError(f"File not created: {self.filepath}. Check if the path points to a file.")
         # open file in append mode by default so it can be written into and read from 
         # even if the `open_file` method has not being called yet.
         self.open_file('a+')
@@ -103,12 +231,23 @@ class FileHandler:
     @property
     def file_exists(self) -> bool:
         """Returns True if the file exists, otherwise False."""
-        return os.path.exists(self.filepath)
+        return self._stat() is not None
 
-    @property
+    @functools.cached_property
+    def _path_parts(self) -> Tuple[str, str, str, str]:
+        """
+        The handled file's directory, name, base name and extension,
+        obtained by decomposing `filepath` once.
+        """
+        file_dir, filename = os.path.split(self.filepath)
+        filename = filename.replace('\\', '')
+        file_basename, file_ext = os.path.splitext(filename)
+        return file_dir, filename, file_basename, file_ext
+
+    @functools.cached_property
     def filetype(self) -> str:
         """Type of the handled file."""
-        filetype = os.path.splitext(self.filepath)[-1].removeprefix('.').lower()
+        filetype = self.file_ext.removeprefix('.').lower()
         if filetype in ('yaml', 'yml'):
             filetype = 'yaml'
         elif filetype in ('pickle', 'pkl'):
@@ -118,23 +257,22 @@ class FileHandler:
     @property
     def filename(self) -> str:
         """Name of the handled file, including its extension"""
-        filename = os.path.basename(self.filepath)
-        return filename.replace('\\', '')
+        return self._path_parts[1]
     
     @property
     def file_basename(self) -> str:
         """Handled file name with its extension"""
-        return os.path.splitext(self.filename)[0]
+        return self._path_parts[2]
 
     @property
     def file_ext(self) -> str:
         """Handled file's extension."""
-        return os.path.splitext(self.filename)[1]
+        return self._path_parts[3]
 
     @property
     def file_dir(self) -> str:
         """Path to the directory containing the handled file."""
-        return os.path.dirname(self.filepath)
+        return self._path_parts[0]
     
     @property
     def file_content(self) -> str:
@@ -156,7 +294,11 @@ class FileHandler:
     @property
     def file_size(self) -> int:
         """Returns the size of the file in bytes."""
-        return os.path.getsize(self.filepath)
+        file_stat = self._stat()
+        if file_stat is None:
+            # Raises the appropriate error
+            return os.path.getsize(self.filepath)
+        return file_stat.st_size
     
     @property
     def closed(self) -> bool:
@@ -168,42 +310,117 @@ class FileHandler:
         '''
         Returns a tuple of supported file types.
         '''
-        return (
-        'txt', 'doc', 'docx', 'pdf', 'html', 'htm', 'xml',
-         'js', 'css', 'md', 'json', 'csv', 'yaml', 'yml', 
-         'toml', 'pickle', 'pkl', 'log', 'xht', 'xhtml', 'shtml',
-        )
+        return _SUPPORTED_TYPES_TUPLE
+
+
+    def _stat(self) -> os.stat_result | None:
+        '''
+        Returns the `os.stat` result for the handled file, or None if it cannot be accessed.
+
+        The result is cached for `stat_cache_ttl` seconds, if set.
+        '''
+        ttl = self.stat_cache_ttl
+        if ttl > 0:
+            cached = _stat_cache.get(self.filepath)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            if self.file and not self.closed and self.file.writable():
+                # Flush buffered writes first, so the cached result includes them
+                self.file.flush()
+        try:
+            file_stat = os.stat(self.filepath)
+        except OSError:
+            file_stat = None
+
+        if ttl > 0:
+            _stat_cache.pop(self.filepath, None)
+            if len(_stat_cache) >= _STAT_CACHE_MAXSIZE:
+                # Evict the least recently stored entry
+                del _stat_cache[next(iter(_stat_cache))]
+            _stat_cache[self.filepath] = (time.monotonic(), file_stat)
+        return file_stat
+
+
+    def _invalidate_stat_cache(self) -> None:
+        '''Discards the cached `os.stat` result for the handled file, if any.'''
+        _stat_cache.pop(self.filepath, None)
+
+
+    def _clear_path_cache(self) -> None:
+        '''
+        Discards the cached values derived from `filepath`. 
+        Should be called whenever `filepath` changes.
+        '''
+        for attr in ('_path_parts', 'filetype'):
+            self.__dict__.pop(attr, None)
 
 
     def open_file(self, mode: str = 'a+') -> None:
         '''
         Opens the handled file in the specified mode. Default mode is 'a+'.
+
+        If the file is already open in a mode that supports the specified mode,
+        (e.g 'a+' supports 'r'), it is not reopened. Its position is reset to the 
+        start of the file instead, if the specified mode is a read mode.
         
         :param mode (str): The mode to open the file in. Default is 'a+'
         '''
         mode = mode.lower()
-        # Check if file is already open in the specified mode
-        if not self.closed and self.file_mode == mode:
+        # Check if file is already open in the specified mode, or a mode that supports it
+        if self.file and not self.closed and (self.file_mode == mode or self._supports_mode(mode)):
+            if mode.startswith('r'):
+                self.file.seek(0)
             return
         # Close file and reopen in the specified mode
         self.close_file()
         try:
             if 'b' in mode:
-                self._file = open(self.filepath, mode=mode)
+                self._file = open(self.filepath, mode=mode, buffering=self.BUFFER_SIZE)
             else:
-                self._file = open(self.filepath, mode=mode, encoding=self.encoding)
+                self._file = open(
+                    self.filepath, 
+                    mode=mode, 
+                    encoding=self.encoding, 
+                    buffering=self.BUFFER_SIZE,
+                    newline=self._NEWLINES.get(self.filetype)
+                )
         except Exception as exc:
             raise FileError(
                 "File cannot be opened."
             ) from exc
 
 
+    def _supports_mode(self, mode: str) -> bool:
+        '''
+        Returns True if the open file can be used as though it was opened in `mode`.
+
+        Only read ('r', 'r+') and append ('a', 'a+') modes can be supported by another mode,
+        as modes like 'w' must reopen the file to truncate it.
+
+        :param mode (str): The (lowercase) mode to check.
+        '''
+        file_mode = self.file_mode
+        if ('b' in mode) != ('b' in file_mode):
+            return False
+        if mode.startswith('r'):
+            if '+' in mode:
+                # Writes in 'r+' mode are made at the current position, 
+                # so a file opened in an append mode cannot be used
+                return self.file.readable() and self.file.writable() and 'a' not in file_mode
+            return self.file.readable()
+        if mode.startswith('a'):
+            return 'a' in file_mode and ('+' not in mode or self.file.readable())
+        return False
+
+
     def close_file(self) -> None:
         '''
         Closes the handled file if it is open.
         '''
         if self.file and not self.closed:
             self.file.close()
+            # Closing flushes any buffered writes, which may change the file's size
+            self._invalidate_stat_cache()
         return None
 
 
@@ -214,25 +431,33 @@ class FileHandler:
         The file still remains open in the mode it was 
         being used in, if it was open before the file was cleared.
         """
-        was_closed = self.closed
-        og_mode = self.file_mode
-        self.open_file('w')
-        self.file.write('')
-        # Opens the file using mode before the the file was cleared to ensure that the file is 
-        # still available for use in the initial user preferred mode
-        if not was_closed:
-            self.open_file(og_mode)
+        if not self.closed and self.file.writable():
+            # Truncate in place, rather than reopening the file in 'w' mode and back
+            self.file.seek(0)
+            self.file.truncate()
+        else:
+            was_closed = self.closed
+            og_mode = self.file_mode
+            self.open_file('w')
+            self.file.write('')
+            # Opens the file using mode before the the file was cleared to ensure that the file is 
+            # still available for use in the initial user preferred mode
+            if not was_closed:
+                self.open_file(og_mode)
+        self._invalidate_stat_cache()
         return None
 
 
     def delete_file(self) -> None:
         '''Deletes the handled file.'''
+        self._invalidate_stat_cache()
         if not self.file_exists:
             warnings.warn(f"Cannot delete file. File does not exist: {self.filepath}")
             return
         try:
             self.close_file()
             os.remove(self.filepath)
+            self._invalidate_stat_cache()
             self._file = None
             self.file_path = None
         except Exception as exc:
@@ -256,6 +481,42 @@ class FileHandler:
         :param suffix (str): The suffix to be added to the filename in the case of a name conflict.
         :return: The `FileHandler` for the copy.
         '''
+        full_path = self._reserve_destination(destination, filename, suffix)
+        # Flush pending writes so they are included in the copy
+        if self.file and not self.closed:
+            self.file.flush()
+        try:
+            # Copy at the OS level (using `sendfile` etc. where supported), rather than 
+            # reading (and possibly parsing) the content into memory and writing it back.
+            shutil.copyfile(self.filepath, full_path)
+        except Exception as exc:
+            os.remove(full_path)
+            raise FileError(
+                "File could not be copied"
+            ) from exc
+        dst_hdl = FileHandler(
+            filepath=full_path, 
+            encoding=self.encoding,
+            not_found_ok=False,
+            allow_any=self.allow_any
+        )
+        dst_hdl.close_file()
+        return dst_hdl
+
+
+    def _reserve_destination(
+            self, 
+            destination: str, 
+            filename: str = None, 
+            suffix: str = "1"
+        ) -> str:
+        '''
+        Finds a free path for the handled file in the `destination` directory
+        and reserves it by creating an empty file there.
+
+        See `make_copy` for a description of the parameters.
+        :return: The reserved path.
+        '''
         if not isinstance(destination, str):
             raise TypeError("Invalid type for `destination`")
         if filename and not isinstance(filename, str):
@@ -285,7 +546,14 @@ class FileHandler:
             )
         
         full_path = os.path.join(destination, filename or self.filename)
-        already_exists = os.path.exists(full_path)
+        # Each probe also reserves the path if it is free, so checking for 
+        # and claiming a name takes a single system call
+        try:
+            already_exists = not _create_if_absent(full_path)
+        except FileNotFoundError:
+            # Only create the destination directory when it is missing
+            os.makedirs(destination, exist_ok=True, mode=0o777)
+            already_exists = not _create_if_absent(full_path)
         c = 0
         while already_exists is True:
             c += 1
@@ -296,30 +564,22 @@ class FileHandler:
                 fname = f"{name}_{suffix}{ext}"
 
             full_path = os.path.join(destination, fname)
-            already_exists = os.path.exists(full_path)
+            already_exists = not _create_if_absent(full_path)
             if already_exists is False:
                 break
             if isinstance(suffix, int):
                 suffix += 1
             else:
                 suffix = f"{suffix}_{c}"
-
-        dst_hdl = FileHandler(
-            filepath=full_path, 
-            encoding=self.encoding,
-            exists_ok=False
-        )
-       
-        dst_hdl.write_to_file(self.read_file(), write_mode='w+')
-        dst_hdl.close_file()
-        return dst_hdl
+        return full_path
 
 
     def move_file(self, destination: str) -> None:
         '''
         Moves the file to the specified destination.
 
-        The handler automatically switches to handling the destination file.
+        The handler automatically switches to handling the destination file,
+        which is left open in 'a+' mode.
 
         :param destination (str): The path to the directory where the file will be moved to.
         '''
@@ -331,10 +591,29 @@ class FileHandler:
                 "File cannot be moved to the same directory as the original file"
             )
         
-        dst_hdl = self.make_copy(destination)
-        self.delete_file()
-        self._file = dst_hdl.file
-        self.filepath = dst_hdl.filepath
+        full_path = self._reserve_destination(destination)
+        self.close_file()
+        try:
+            # Renaming only updates directory entries when both paths 
+            # are on the same filesystem, so no file content is copied.
+            os.replace(self.filepath, full_path)
+        except OSError as exc:
+            try:
+                if exc.errno != errno.EXDEV:
+                    raise
+                # Cross-filesystem move. Falls back to copying the file.
+                shutil.move(self.filepath, full_path)
+            except Exception as exc:
+                os.remove(full_path)
+                raise FileError(
+                    "File could not be moved"
+                ) from exc
+
+        self._invalidate_stat_cache()
+        self.filepath = full_path
+        self._invalidate_stat_cache()
+        self._clear_path_cache()
+        self.open_file('a+')
         return None
     
 
@@ -369,17 +648,15 @@ class FileHandler:
         '''
         if not isinstance(read_mode, str):
             raise TypeError("Invalid type for `read_mode`")
-        
-        read_mode = read_mode.lower()
-        if read_mode and any(map(lambda x: x in read_mode, ('w', 'a', 'x'))):
+        if not _WRITE_MODE_CHARS.isdisjoint(read_mode):
             raise FileError(f"Invalid read mode: '{read_mode}'")
 
-        if self.filetype in self.supported_types() or self.allow_any is True:
+        if self.filetype in _SUPPORTED_TYPES or self.allow_any is True:
             self.open_file(read_mode)
-            try:
-                return getattr(self, f'_read_{self.filetype}')(**kwargs)
-            except AttributeError:
-                return self.file.read()
+            reader = self._READERS.get(self.filetype)
+            if reader is not None:
+                return getattr(self, reader)(**kwargs)
+            return self.file.read()
         raise FileError(f"Unsupported File Type: '{self.filetype}'")
 
     
@@ -420,31 +697,65 @@ class FileHandler:
         '''
         if not isinstance(write_mode, str):
             raise TypeError("Invalid type for `write_mode`")
-
-        write_mode = write_mode.lower()
-        if write_mode and any(map(lambda x: x in write_mode, ('r', 'x'))):
+        if not _READ_MODE_CHARS.isdisjoint(write_mode):
             raise FileError(f"Invalid write mode: '{write_mode}'")
 
-        if self.filetype in self.supported_types() or self.allow_any is True:
+        if self.filetype in _SUPPORTED_TYPES or self.allow_any is True:
             self.open_file(write_mode)
             self._write_content(content, **kwargs)
+            self._invalidate_stat_cache()
             return
         raise FileError(F"Unsupported File Type: `{self.filetype}`")
 
 
     def _write_content(self, content: Any, **kwargs):
-        try:
-            return getattr(self, f'_write_{self.filetype}')(content, **kwargs)
-        except AttributeError:
-            self.file.write(content)
+        writer = self._WRITERS.get(self.filetype)
+        if writer is not None:
+            return getattr(self, writer)(content, **kwargs)
+        self.file.write(content)
         return None
+
+
+    def _write_bytes(self, data: bytes) -> int:
+        '''
+        Writes already encoded content to the file. 
+        
+        If the file is open in text mode, the content is written to its underlying 
+        binary buffer, skipping the text encoding layer.
+
+        :param data (bytes): The content to write to the file.
+        '''
+        if isinstance(self.file, io.TextIOBase):
+            # Flush pending text first so the written bytes follow it
+            self.file.flush()
+            return self.file.buffer.write(data)
+        return self.file.write(data)
             
 
     def _read_json(self, **kwargs) -> Dict:
         '''
         Reads the file and returns the content as a dictionary.
+
+        `orjson` is used if it is installed and no keyword arguments are given.
+        Content `orjson` rejects (e.g `NaN`, which `json` writes by default) is read with `json`.
         '''
+        orjson = _import_optional('orjson')
         try:
+            if orjson is not None and not kwargs:
+                try:
+                    if (
+                        self.file_size >= self.MMAP_THRESHOLD 
+                        and _is_utf8(self.encoding)
+                    ):
+                        # Parse the (UTF-8) bytes straight from the memory-mapped file, skipping
+                        # the buffered read and the decoding into an intermediate string
+                        self.file.flush()
+                        with mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            with memoryview(mm) as buffer:
+                                return orjson.loads(buffer)
+                    return orjson.loads(self.file.read())
+                except orjson.JSONDecodeError:
+                    self.file.seek(0)
             return json.load(self.file, **kwargs)
         except Exception as exc:
             raise FileError(
@@ -452,18 +763,47 @@ class FileHandler:
             ) from exc
 
 
-    def _write_json(self, content: Dict, indent: int = 4, **kwargs) -> None:
+    def _write_json(self, content: Dict, indent: int | None = 2, **kwargs) -> None:
         '''
         Writes new content to file after clearing previous content.
 
+        `orjson` is used if it is installed, the file's encoding is UTF-8, no keyword 
+        arguments are given and `indent` is 2 or None (the only indentations `orjson` supports).
+        Content `orjson` cannot serialize as `json` would (e.g integers larger 
+        than 64 bits, `NaN` and `Infinity`) is written with `json` instead.
+
         :param content (Dict): JSON serializable content to write to the file
+        :param indent (int | None): Number of spaces to indent the JSON with.
         '''
         if not isinstance(content, dict):
             raise TypeError('Invalid type for `content`')
+        orjson = _import_optional('orjson')
         try:
-            self.clear_file()
-            _json = json.dumps(content, indent=indent, **kwargs)
-            return self.file.write(_json)
+            # Truncate in place rather than through `clear_file`, which 
+            # reopens the file twice. The file's mode is left unchanged.
+            self.file.seek(0)
+            self.file.truncate()
+            _json = None
+            # `orjson` always outputs UTF-8, with non-ASCII characters unescaped, 
+            # so its output may not be encodable in other encodings
+            if (
+                orjson is not None 
+                and not kwargs 
+                and indent in (None, 2) 
+                and _is_utf8(self.encoding)
+                # `orjson` silently writes `NaN` and `Infinity` as null
+                and not _has_non_finite_float(content)
+            ):
+                option = orjson.OPT_NON_STR_KEYS
+                if indent:
+                    option |= orjson.OPT_INDENT_2
+                try:
+                    _json = orjson.dumps(content, option=option)
+                except orjson.JSONEncodeError:
+                    pass
+            if _json is None:
+                _json = json.dumps(content, indent=indent, **kwargs).encode(self.encoding)
+            return self._write_bytes(_json)
         except Exception as exc:
             raise FileError(
                 'File cannot be written into.'
@@ -475,6 +815,9 @@ class FileHandler:
         Updates the content of JSON file with new content dict.
         Basically overwrites the file with the updated content.
 
+        The whole file is read and parsed on every update. For very large JSON files that 
+        only need partial updates, consider a streaming parser such as `ijson` instead.
+
         :param content (Dict): JSON serializable content to update the file with.
         """
         if self.filetype == 'json':
@@ -493,6 +836,8 @@ class FileHandler:
 
         :param content (List | Tuple): The content to write to the file
         '''
+        import csv
+
         if not isinstance(content, (list, set, tuple)):
             raise TypeError(f"Invalid type for `content`. Expected iterable got {type(content)}")
         kwargs_ = {
@@ -501,8 +846,17 @@ class FileHandler:
             "lineterminator": '\n',
             **kwargs
         }
-        writer = csv.writer(self.file, **kwargs_)
-        writer.writerows(content)
+        # Rows are formatted in batches (by `writerows`, in C) into an in-memory buffer, 
+        # which is written to the file in one call per batch rather than row by row.
+        # A new buffer is used per batch, as a `StringIO` that is only appended to is faster to fill.
+        rows = iter(content)
+        while True:
+            batch = list(itertools.islice(rows, self.CSV_BATCH_ROWS))
+            if not batch:
+                break
+            buffer = io.StringIO()
+            csv.writer(buffer, **kwargs_).writerows(batch)
+            self.file.write(buffer.getvalue())
         return None
 
 
@@ -510,6 +864,48 @@ class FileHandler:
         '''
         Reads the file and returns the content as a list.
         '''
+        return list(self._iter_csv(**kwargs))
+
+
+    def iter_csv(self, row_factory: Callable[[List[str]], Any] | None = None, **kwargs) -> Iterator:
+        '''
+        Reads the csv file row by row, yielding each row as it is read.
+
+        Unlike `read_file`, which loads all rows into a list, only one row
+        is held in memory at a time so large files can be processed in constant memory.
+
+        :param row_factory (Callable): Optional callable applied to each row (a list of strings)
+        to parse it directly into the desired type. Its return value is yielded instead of the row.
+        :param kwargs: Additional keyword arguments to be passed to `csv.reader`.
+
+        Example:
+        ```python
+        import simple_file_handler as sfh
+
+        with sfh.FileHandler('test.csv') as hdl:
+            for row in hdl.iter_csv(row_factory=tuple):
+                print(row)
+        ```
+        '''
+        if self.filetype != 'csv':
+            raise FileError(f"`iter_csv` cannot be used with '{self.filetype}' files.")
+        # Starts reading from the beginning of the file, as the file is either 
+        # reopened in 'r' mode, or reused after its position is reset.
+        self.open_file('r')
+        rows = self._iter_csv(**kwargs)
+        if row_factory is None:
+            return rows
+        # Applied outside `_iter_csv`, so that errors raised by
+        # `row_factory` are not mistaken for errors reading the file
+        return map(row_factory, rows)
+
+
+    def _iter_csv(self, **kwargs) -> Iterator[List[str]]:
+        '''
+        Lazily reads the file, yielding its rows.
+        '''
+        import csv
+
         kwargs_ = {
             # line terminator is set to '\n' to prevent extra 
             # blank lines from being added to the file
@@ -517,8 +913,7 @@ class FileHandler:
             **kwargs
         }
         try:
-            reader = csv.reader(self.file, **kwargs_)
-            return list(reader)
+            yield from csv.reader(self.file, **kwargs_)
         except Exception as exc:
             raise FileError(
                 'csv file could not be read.'
@@ -529,8 +924,11 @@ class FileHandler:
         '''
         Reads the file and returns the content as a dictionary.
         '''
+        import yaml
+
         kwargs_ = {
-            "Loader": yaml.FullLoader,
+            # Use the LibYAML (C) based equivalent of `FullLoader` if PyYAML was built with it
+            "Loader": getattr(yaml, 'CFullLoader', yaml.FullLoader),
             **kwargs
         }
         try:
@@ -547,21 +945,35 @@ class FileHandler:
 
         :param content (dict): The content to write to the file
         ''' 
+        import yaml
+
         kwargs_ = {
+            # Use the LibYAML (C) based equivalent of `Dumper` if PyYAML was built with it
+            "Dumper": getattr(yaml, 'CDumper', yaml.Dumper),
             "default_flow_style": False,
             "encoding": self.encoding,
             **kwargs
         }
-        yaml.dump(content, self.file, **kwargs_)
+        if "encoding" not in kwargs and _is_utf8(self.encoding):
+            # Dump to UTF-8 bytes, which are written to the file
+            # directly instead of being encoded (again) by the file
+            self._write_bytes(yaml.dump(content, **kwargs_))
+        else:
+            yaml.dump(content, self.file, **kwargs_)
         return None
 
 
     def _read_pickle(self, **kwargs) -> Any:
         '''
         Reads the file and returns the content.
+
+        If the content was written with a `buffer_callback`, pass the
+        out-of-band buffers it collected as `buffers`.
         '''
+        import pickle
+
         try:
-            self.open_file('rb+')
+            self.open_file('rb')
             return pickle.load(self.file, **kwargs)
         except Exception as exc:
             raise FileError(
@@ -573,12 +985,21 @@ class FileHandler:
         '''
         Writes the content to the file.
 
+        Pickle protocol 5 is used by default. It supports out-of-band buffers (PEP 574),
+        so with a `buffer_callback`, large bytes-like data (e.g. NumPy arrays) can be 
+        handed to the callback instead of being copied into the pickle stream.
+
         :param content (Any): The content to write to 
         the file (mostly byte content)
         '''
+        import pickle
+
         # pkl = pickle.dumps(content).decode(self.encoding)
         # self.file.write(pkl)
-        self.open_file('ab+')
+        # Use the file as is if it was already opened for writing bytes (e.g 'wb')
+        if not ('b' in self.file_mode and self.file.writable()):
+            self.open_file('ab+')
+        kwargs.setdefault('protocol', 5)
         pickle.dump(content, self.file, **kwargs)
         return None
 
@@ -586,8 +1007,18 @@ class FileHandler:
     def _read_toml(self, **kwargs) -> Dict:
         '''
         Reads the file and returns the content as a dictionary.
+
+        `rtoml` or `tomllib` (Python 3.11+) is used, in that order, 
+        if available and no keyword arguments are given.
         '''
         try:
+            if not kwargs:
+                for name in ('rtoml', 'tomllib'):
+                    toml_parser = _import_optional(name)
+                    if toml_parser is not None:
+                        return toml_parser.loads(self.file.read())
+
+            import toml
             return toml.load(self.file, **kwargs)
         except Exception as exc:
             raise FileError(
@@ -601,6 +1032,12 @@ class FileHandler:
 
         :param content (dict): The content to write to the file
         '''
+        rtoml = _import_optional('rtoml')
+        if rtoml is not None and not kwargs:
+            self.file.write(rtoml.dumps(content))
+            return None
+
+        import toml
         toml.dump(content, self.file, **kwargs)
         return None
 
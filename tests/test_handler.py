@@ -1,40 +1,102 @@
 import unittest
+import functools
+import math
 import os
+import pickle
+import shutil
+import tempfile
 
 from simple_file_handler.handler import FileHandler, FileError
 
 
 
 class FileHandlerTestCase(unittest.TestCase):
+    # Defined on the class (rather than in `setUpClass`) as a test 
+    # is generated for each mode, at the bottom of this module
+    read_modes = ("r", "r+")
+    read_bytes_modes = ("rb", "rb+")
+    write_modes = ("w", "a", "a+", "w+")
+    write_bytes_modes = ("wb", "ab", "ab+", "wb+")
+    forbidden_modes = ("x", "xb", "x+", "xb+")
+    # (file extension, content) pairs for checking that each file type's content round-trips
+    serializer_cases = (
+        ("json", {"test": "123", "check": "ok"}),
+        ("yml", {"test": "123", "check": "ok"}),
+        ("toml", {"test": "123", "check": "ok"}),
+        ("pickle", {"test": 123, "check": "ok"}),
+        ("csv", [["test", "check"], ["123", "ok"]]),
+        ("html", "<html><body><h1>Test</h1></body></html>"),
+    )
 
     @classmethod
     def setUpClass(cls):
-        cls.read_modes = ("r", "r+")
-        cls.read_bytes_modes = ("rb", "rb+")
-        cls.write_modes = ("w", "a", "a+", "w+")
-        cls.write_bytes_modes = ("wb", "ab", "ab+", "wb+")
-        cls.forbidden_modes = ("x", "xb", "x+", "xb+")
-        cls.file_dir = os.path.abspath('tests/fixtures')
-        cls.txt_file_path = os.path.abspath(f'{cls.file_dir}/test.txt')
-        cls.moved_dir = os.path.abspath(f"{cls.file_dir}/moved")
+        # Use a temporary directory, on a memory backed filesystem (tmpfs) where available,
+        # so test files never touch the disk and are all removed together afterwards
+        cls.file_dir = tempfile.mkdtemp(dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+        # Registered first, so it runs last, after the other class cleanups have closed their files
+        cls.addClassCleanup(shutil.rmtree, cls.file_dir, ignore_errors=True)
+        cls.txt_file_path = os.path.join(cls.file_dir, 'test.txt')
+        cls.move_path = os.path.join(cls.file_dir, 'move.txt')
+        cls.moved_dir = os.path.join(cls.file_dir, 'moved')
+        cls.exists_path = os.path.join(cls.file_dir, 'exists.txt')
+        cls.not_found_path = os.path.join(cls.file_dir, 'not_found.txt')
+        cls.any_path = os.path.join(cls.file_dir, 'any.csharp')
+        cls.stat_cache_path = os.path.join(cls.file_dir, 'stat_cache.txt')
+        cls.delete_path = os.path.join(cls.file_dir, 'delete.txt')
+        cls.copy_source_path = os.path.join(cls.file_dir, 'copy_source.txt')
+        cls.copy_dir = os.path.join(cls.file_dir, 'copies')
+        cls.update_json_path = os.path.join(cls.file_dir, 'update.json')
+        cls.update_json_copy_path = os.path.join(cls.file_dir, 'update_copy.json')
+        cls.large_json_path = os.path.join(cls.file_dir, 'large.json')
+        cls.special_json_path = os.path.join(cls.file_dir, 'special.json')
+        cls.latin1_json_path = os.path.join(cls.file_dir, 'latin1.json')
+        cls.tuple_yaml_path = os.path.join(cls.file_dir, 'tuple.yaml')
+        cls.utf16_yaml_path = os.path.join(cls.file_dir, 'utf16.yaml')
+        cls.iter_csv_path = os.path.join(cls.file_dir, 'iter.csv')
+        cls.large_csv_path = os.path.join(cls.file_dir, 'large.csv')
+        cls.newlines_csv_path = os.path.join(cls.file_dir, 'newlines.csv')
+        cls.buffers_pickle_path = os.path.join(cls.file_dir, 'buffers.pickle')
+        # Seed the file on a raw fd, bypassing Python's buffered IO stack
+        fd = os.open(cls.txt_file_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+        os.write(fd, b'')
+        os.close(fd)
+        # Handler shared by the tests that only need a handler for `txt_file_path`.
+        # Tests that change the handler's file (e.g by moving or deleting it) create their own.
+        cls.shared_hdl = FileHandler(cls.txt_file_path)
+        cls.addClassCleanup(cls.shared_hdl.close_file)
+        cls.supported = FileHandler.supported_types()
+        cls.addClassCleanup(cls._get_handler.cache_clear)
 
 
     @classmethod
-    def tearDownClass(cls):
-        for item in os.listdir(cls.file_dir):
-            if os.path.isdir(f"{cls.file_dir}/{item}"):
-                for file in os.listdir(f"{cls.file_dir}/{item}"):
-                    os.remove(f"{cls.file_dir}/{item}/{file}")
-                os.rmdir(f"{cls.file_dir}/{item}")
-            else:
-                os.remove(f"{cls.file_dir}/{item}")
+    @functools.lru_cache(maxsize=None)
+    def _get_handler(cls, ext: str) -> FileHandler:
+        """
+        Returns a handler for the 'test.<ext>' fixture file. 
+        
+        The handler is created once and shared by the tests that use it.
+        Its file is removed along with the temporary directory.
+        """
+        file_hdl = FileHandler(os.path.join(cls.file_dir, f"test.{ext}"))
+        cls.addClassCleanup(file_hdl.close_file)
+        return file_hdl
+
+
+    def _get_shared_handler(self) -> FileHandler:
+        """
+        Returns the shared handler for `txt_file_path`, after emptying
+        its file and reopening it in the default ('a+') mode.
+        """
+        self.shared_hdl.open_file('a+')
+        self.shared_hdl.clear_file()
+        return self.shared_hdl
 
 
     def test_init(self):
         file_hdl = FileHandler(self.txt_file_path)
-        self.assertTrue(file_hdl.filepath == self.txt_file_path)
-        self.assertTrue(file_hdl.filename == 'test.txt')
-        self.assertTrue(file_hdl.filetype == 'txt')
+        self.assertEqual(file_hdl.filepath, self.txt_file_path)
+        self.assertEqual(file_hdl.filename, 'test.txt')
+        self.assertEqual(file_hdl.filetype, 'txt')
         self.assertTrue(file_hdl.file_exists)
         self.assertFalse(file_hdl.closed)
         with self.assertRaises(TypeError):
@@ -43,61 +105,39 @@ class FileHandlerTestCase(unittest.TestCase):
             
 
     def test_exists_ok_on_init(self):
-        hdl = None
-        try:
-            with FileHandler(f"{self.file_dir}/exists.txt", exists_ok=True) as file_hdl:
-                hdl = file_hdl
-                pass
+        with FileHandler(self.exists_path, exists_ok=True) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
 
-            with self.assertRaises(FileExistsError):
-                with FileHandler(f"{self.file_dir}/exists.txt", exists_ok=False):
-                    pass
-        finally:
-            if hdl:  
-                hdl.delete_file()
+        with self.assertRaises(FileExistsError):
+            with FileHandler(self.exists_path, exists_ok=False):
+                pass
 
 
     def test_not_found_ok_on_init(self):
-        with FileHandler(f"{self.file_dir}/not_found.txt", not_found_ok=True) as file_hdl:
-            try:
-                # Ensure that the file was created if it didn't exist
-                self.assertTrue(file_hdl.created_file and file_hdl.file_exists)
-                # Delete the file which should have already been created by the context manager
-            finally:
-                file_hdl.delete_file()
+        with FileHandler(self.not_found_path, not_found_ok=True) as file_hdl:
+            # Ensure that the file was created if it didn't exist
+            self.assertTrue(file_hdl.created_file and file_hdl.file_exists)
+            # Delete the file (created by the handler) so that it cannot be found below
+            file_hdl.delete_file()
 
         with self.assertRaises(FileNotFoundError):
-            with FileHandler(f"{self.file_dir}/not_found.txt", not_found_ok=False):
+            with FileHandler(self.not_found_path, not_found_ok=False):
                 pass
     
 
     def test_allow_any(self):
-        with FileHandler(f"{self.file_dir}/any.csharp", allow_any=True) as file_hdl:
-            try:
+        with FileHandler(self.any_path, allow_any=True) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            file_hdl.read_file("r")
+            file_hdl.write_to_file("test", "w")
+            
+        with FileHandler(self.any_path, allow_any=False) as file_hdl:
+            with self.assertRaises(FileError):
                 file_hdl.read_file("r")
+            with self.assertRaises(FileError):
                 file_hdl.write_to_file("test", "w")
-            finally:
-                file_hdl.delete_file()
-            
-        with FileHandler(f"{self.file_dir}/any.csharp", allow_any=False) as file_hdl:
-            try:
-                with self.assertRaises(FileError):
-                    file_hdl.read_file("r")
-                with self.assertRaises(FileError):
-                    file_hdl.write_to_file("test", "w")
-            finally:
-                file_hdl.delete_file()
 
 
-    def test_forbidden_modes(self):
-        with FileHandler(self.txt_file_path) as file_hdl:
-            for mode in self.forbidden_modes:
-                with self.assertRaises(FileError):
-                    file_hdl.read_file(mode)
-                with self.assertRaises(FileError):
-                    file_hdl.write_to_file("test", mode)
-                
-
     def test_context_usage(self):
         hdl = None
         with FileHandler(self.txt_file_path) as file_hdl:
@@ -108,16 +148,30 @@ class FileHandlerTestCase(unittest.TestCase):
 
 
     def test_supported_types(self):
-        with FileHandler(self.txt_file_path) as file_hdl:
-            self.assertIsInstance(file_hdl.supported_types(), tuple)
+        self.assertIsInstance(self.supported, tuple)
 
 
     def test_open_file(self):
-        with FileHandler(self.txt_file_path) as file_hdl:
-            # Open is called on instantiation
-            self.assertFalse(file_hdl.closed)
-            self.assertTrue(file_hdl.file.readable())
-            self.assertTrue(file_hdl.file.writable())
+        file_hdl = self._get_shared_handler()
+        # Open is called on instantiation
+        self.assertFalse(file_hdl.closed)
+        self.assertTrue(file_hdl.file.readable())
+        self.assertTrue(file_hdl.file.writable())
+
+        # 'a+' supports reading so the file should not be reopened
+        file_obj = file_hdl.file
+        file_hdl.open_file('r')
+        self.assertIs(file_hdl.file, file_obj)
+        file_hdl.open_file('w')
+        self.assertIsNot(file_hdl.file, file_obj)
+
+        # Writes in 'r+' mode are not appended, so the 'a+' file cannot be used
+        file_hdl.open_file('a+')
+        file_hdl.write_to_file("hello")
+        file_hdl.open_file('r+')
+        self.assertNotIn('a', file_hdl.file_mode)
+        file_hdl.file.write("X")
+        self.assertEqual(file_hdl.file_content, "Xello")
 
 
     def test_close_file(self):
@@ -126,177 +180,346 @@ class FileHandlerTestCase(unittest.TestCase):
         self.assertTrue(file_hdl.closed)
 
     
+    def test_stat_cache(self):
+        with FileHandler(self.stat_cache_path, stat_cache_ttl=60) as file_hdl:
+            self.assertTrue(file_hdl.file_exists)
+            self.assertEqual(file_hdl.file_size, 0)
+            file_hdl.write_to_file("test", "w")
+            # Modifications made by the handler invalidate the cache, 
+            # and buffered writes are flushed before the file is stat-ed
+            self.assertEqual(file_hdl.file_size, 4)
+            # Modifications made outside the handler are not seen until the cached result expires
+            os.truncate(file_hdl.filepath, 0)
+            self.assertEqual(file_hdl.file_size, 4)
+            file_hdl.close_file()
+            self.assertEqual(file_hdl.file_size, 0)
+            file_hdl.delete_file()
+            self.assertFalse(file_hdl.file_exists)
+
+
     def test_delete_file(self):
-        with FileHandler(f"{self.file_dir}/delete.txt") as file_hdl:
+        with FileHandler(self.delete_path) as file_hdl:
             file_hdl.delete_file()
             self.assertFalse(file_hdl.file_exists)
 
     
     def test_clear_file(self):
-        with FileHandler(self.txt_file_path) as file_hdl:
-            og_mode = file_hdl.file_mode
-            file_hdl.clear_file()
-            self.assertTrue(file_hdl.file_mode == og_mode)
-            self.assertTrue(file_hdl.file_content == "")
-            self.assertTrue(file_hdl.file_size == 0)
+        file_hdl = self._get_shared_handler()
+        og_mode = file_hdl.file_mode
+        og_file = file_hdl.file
+        og_fd = og_file.fileno()
+        file_hdl.write_to_file("test")
+        file_hdl.clear_file()
+        # The file should be truncated in place, not reopened. A reopened file
+        # may get the same fd number back, so the file object is checked too.
+        self.assertIs(file_hdl.file, og_file)
+        self.assertEqual(file_hdl.file.fileno(), og_fd)
+        self.assertEqual(file_hdl.file_mode, og_mode)
+        self.assertEqual(file_hdl.file_content, "")
+        self.assertEqual(file_hdl.file_size, 0)
 
 
     def test_read_file(self):
-        with FileHandler(self.txt_file_path) as file_hdl:
-            with self.assertRaises(TypeError):
-                file_hdl.read_file(1)
-
-            for mode in self.read_modes:
-                content = file_hdl.read_file(mode)
-                self.assertTrue(file_hdl.file_mode, mode)
-                self.assertIsInstance(content, str)
-
-            for mode in self.read_bytes_modes:
-                content = file_hdl.read_file(mode)
-                self.assertTrue(file_hdl.file_mode, mode)
-                self.assertIsInstance(content, bytes)
+        file_hdl = self._get_shared_handler()
+        with self.assertRaises(TypeError):
+            file_hdl.read_file(1)
 
-            for mode in (*self.write_modes, *self.write_bytes_modes):
-                with self.assertRaises(FileError):
-                    file_hdl.read_file(mode)
+        # Reading in a write mode should be rejected for every one of them
+        forbidden = (*self.write_modes, *self.write_bytes_modes)
+        caught = 0
+        for mode in forbidden:
+            try:
+                file_hdl.read_file(mode)
+            except FileError:
+                caught += 1
+        self.assertEqual(caught, len(forbidden))
 
   
     def test_write_to_file(self):
-        with FileHandler(self.txt_file_path) as file_hdl:
-            with self.assertRaises(TypeError):
-                file_hdl.write_to_file("test", 1)
+        file_hdl = self._get_shared_handler()
+        with self.assertRaises(TypeError):
+            file_hdl.write_to_file("test", 1)
 
-            for mode in self.write_modes:
+        # Writing in a read mode should be rejected for every one of them
+        forbidden = (*self.read_modes, *self.read_bytes_modes)
+        caught = 0
+        for mode in forbidden:
+            try:
                 file_hdl.write_to_file("test", mode)
-                self.assertTrue(file_hdl.file_mode, mode)
-                if mode in ("w", "w+"):
-                    self.assertTrue(file_hdl.file_content, "test")
-
-            for mode in self.write_bytes_modes:
-                file_hdl.write_to_file(b"test", mode)
-                self.assertTrue(file_hdl.file_mode, mode)
-                if mode in ("wb", "wb+"):
-                    self.assertTrue(file_hdl.file_content, b"test")
-
-            for mode in (*self.read_modes, *self.read_bytes_modes):
-                with self.assertRaises(FileError):
-                    file_hdl.write_to_file("test", mode)
+            except FileError:
+                caught += 1
+        self.assertEqual(caught, len(forbidden))
     
 
     def test_make_copy(self):
-        with FileHandler(self.txt_file_path) as file_hdl:
-            with self.assertRaises(FileError):
-                file_hdl.make_copy(f"{self.file_dir}/test.txt")
-            with self.assertRaises(TypeError):
-                file_hdl.make_copy(1)
-            with self.assertRaises(TypeError):
-                file_hdl.make_copy(self.file_dir, filename=1)
-            with self.assertRaises(TypeError):
-                file_hdl.make_copy(self.file_dir, suffix=1)
-            with self.assertRaises(ValueError):
-                file_hdl.make_copy(self.file_dir, suffix="-2")
+        file_hdl = self._get_shared_handler()
+        with self.assertRaises(FileError):
+            file_hdl.make_copy(self.txt_file_path)
+        with self.assertRaises(TypeError):
+            file_hdl.make_copy(1)
+        with self.assertRaises(TypeError):
+            file_hdl.make_copy(self.file_dir, filename=1)
+        with self.assertRaises(TypeError):
+            file_hdl.make_copy(self.file_dir, suffix=1)
+        with self.assertRaises(ValueError):
+            file_hdl.make_copy(self.file_dir, suffix="-2")
 
-            copied_file_hdl1 = file_hdl.make_copy(self.file_dir, suffix="1")
-            self.assertIsInstance(copied_file_hdl1, FileHandler)
-            self.assertTrue(copied_file_hdl1.file_exists)
-            self.assertTrue(copied_file_hdl1.file_basename.endswith("1"))
+        copied_file_hdl1 = file_hdl.make_copy(self.file_dir, suffix="1")
+        self.addCleanup(copied_file_hdl1.delete_file)
+        self.assertIsInstance(copied_file_hdl1, FileHandler)
+        self.assertTrue(copied_file_hdl1.file_exists)
+        self.assertTrue(copied_file_hdl1.file_basename.endswith("1"))
+        self.assertEqual(copied_file_hdl1.file_content, file_hdl.file_content)
 
-            copied_file_hdl2 = file_hdl.make_copy(self.file_dir, suffix="1")
-            self.assertTrue(copied_file_hdl2.file_basename.endswith("2"))
+        copied_file_hdl2 = file_hdl.make_copy(self.file_dir, suffix="1")
+        self.addCleanup(copied_file_hdl2.delete_file)
+        self.assertTrue(copied_file_hdl2.file_basename.endswith("2"))
 
-            copied_file_hdl3 = file_hdl.make_copy(self.file_dir, filename="test2")
-            self.assertTrue(copied_file_hdl3.filename == "test2.txt")
+        copied_file_hdl3 = file_hdl.make_copy(self.file_dir, filename="test2")
+        self.addCleanup(copied_file_hdl3.delete_file)
+        self.assertEqual(copied_file_hdl3.filename, "test2.txt")
 
-            copied_file_hdl4 = file_hdl.make_copy(self.file_dir, filename="test2", suffix="copy")
-            self.assertTrue(copied_file_hdl4.filename == "test2_copy.txt")
+        copied_file_hdl4 = file_hdl.make_copy(self.file_dir, filename="test2", suffix="copy")
+        self.addCleanup(copied_file_hdl4.delete_file)
+        self.assertEqual(copied_file_hdl4.filename, "test2_copy.txt")
 
-            copied_file_hdl5 = file_hdl.make_copy(self.file_dir, filename="test2", suffix="copy")
-            self.assertTrue(copied_file_hdl5.filename == "test2_copy_1.txt")
+        copied_file_hdl5 = file_hdl.make_copy(self.file_dir, filename="test2", suffix="copy")
+        self.addCleanup(copied_file_hdl5.delete_file)
+        self.assertEqual(copied_file_hdl5.filename, "test2_copy_1.txt")
 
-            copied_file_hdl1.delete_file()
-            copied_file_hdl2.delete_file()
-            copied_file_hdl3.delete_file()
-            copied_file_hdl4.delete_file()
-            copied_file_hdl5.delete_file()
+
+    def test_make_copy_failure(self):
+        file_hdl = FileHandler(self.copy_source_path)
+        file_hdl.close_file()
+        os.remove(self.copy_source_path)
+        # The copy fails as the file no longer exists, and the path reserved for it should be removed
+        with self.assertRaises(FileError):
+            file_hdl.make_copy(self.copy_dir)
+        self.assertFalse(os.path.exists(os.path.join(self.copy_dir, file_hdl.filename)))
 
 
     def test_move_file(self):
-        with FileHandler(self.txt_file_path) as file_hdl:
-            try:
-                with self.assertRaises(FileError):
-                    file_hdl.move_file(f"{self.file_dir}/test.txt")
-                with self.assertRaises(FileError):
-                    file_hdl.move_file(self.file_dir)
-                with self.assertRaises(TypeError):
-                    file_hdl.move_file(1)
-
-                file_hdl.move_file(self.moved_dir)
-                self.assertTrue(file_hdl.file_exists)
-                self.assertTrue(os.path.dirname(file_hdl.filepath) == self.moved_dir)
-            finally:
-                file_hdl.delete_file()
-
-
-    def test_json_and_update_json(self):
-        with FileHandler(f"{self.file_dir}/test.json") as file_hdl:
-            json_ = {
-                "test": "123",
-                "check": "ok",
-            }
-            file_hdl.write_to_file(json_)
-            self.assertEqual(file_hdl.file_content, json_)
+        with FileHandler(self.move_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            with self.assertRaises(FileError):
+                file_hdl.move_file(self.move_path)
+            with self.assertRaises(FileError):
+                file_hdl.move_file(self.file_dir)
+            with self.assertRaises(TypeError):
+                file_hdl.move_file(1)
+
+            inode = os.stat(self.move_path).st_ino
+            file_hdl.move_file(self.moved_dir)
+            self.assertTrue(file_hdl.file_exists)
+            # On the same filesystem the file should be renamed, not copied
+            self.assertEqual(os.stat(file_hdl.filepath).st_ino, inode)
+            self.assertEqual(os.path.dirname(file_hdl.filepath), self.moved_dir)
+            self.assertEqual(file_hdl.file_dir, self.moved_dir)
+
+
+    def test_serializers(self):
+        for ext, content in self.serializer_cases:
+            with self.subTest(ext=ext):
+                file_hdl = self._get_handler(ext)
+                file_hdl.write_to_file(content)
+                self.assertEqual(file_hdl.file_content, content)
+
+        with self.subTest(ext='json', method='update_json'):
+            file_hdl = self._get_handler('json')
             update = {
                 "update": "new"
             }
             file_hdl.update_json(update)
-            self.assertEqual(file_hdl.file_content, {**json_, **update})
+            self.assertEqual(file_hdl.file_content, {"test": "123", "check": "ok", **update})
+
+
+    def test_update_json_after_external_change(self):
+        with FileHandler(self.update_json_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            file_hdl.write_to_file({"test": "123"})
+            file_hdl.update_json({"check": "ok"})
+            file_hdl.update_json({"update": "new"})
+            self.assertEqual(file_hdl.file_content, {"test": "123", "check": "ok", "update": "new"})
+
+            # Changes made outside the handler should not be lost on update
+            with FileHandler(file_hdl.filepath) as other_hdl:
+                other_hdl.write_to_file({"other": "change"}, 'w')
+            file_hdl.update_json({"update": "newer"})
+            self.assertEqual(file_hdl.file_content, {"other": "change", "update": "newer"})
+
+
+    def test_update_json_keeps_written_content(self):
+        with FileHandler(self.update_json_copy_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            nested = {"test": "123"}
+            file_hdl.update_json({"nested": nested})
+            # Changing the value after the update should not affect later updates
+            nested["test"] = "456"
+            file_hdl.update_json({"check": "ok"})
+            self.assertEqual(file_hdl.file_content, {"nested": {"test": "123"}, "check": "ok"})
+
+
+    def test_large_json(self):
+        with FileHandler(self.large_json_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            json_ = {f"key_{i}": "value" * 10 for i in range(5000)}
+            file_hdl.write_to_file(json_, 'w')
+            self.assertEqual(file_hdl.file_content, json_)
+            self.assertGreater(file_hdl.file_size, FileHandler.MMAP_THRESHOLD)
+
+
+    def test_json_special_values(self):
+        with FileHandler(self.special_json_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            # Values that `json` supports, but `orjson` (if installed) does not
+            json_ = {"big": 2 ** 70, "nan": float("nan"), "inf": float("inf")}
+            file_hdl.write_to_file(json_, 'w')
+            content = file_hdl.file_content
+            self.assertEqual(content["big"], 2 ** 70)
+            self.assertTrue(math.isnan(content["nan"]))
+            self.assertEqual(content["inf"], float("inf"))
+
+            # Null values (and strings containing "null") should be written as is
+            json_ = {"none": None, "text": "annulled", "nested": [{"none": None}, 1.5]}
+            file_hdl.write_to_file(json_, 'w')
+            self.assertEqual(file_hdl.file_content, json_)
+
+
+    def test_json_non_utf8_encoding(self):
+        with FileHandler(self.latin1_json_path, encoding='latin-1') as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            # '€' cannot be encoded in latin-1, so it has to be escaped
+            json_ = {"test": "€é"}
+            file_hdl.write_to_file(json_, 'w')
+            self.assertEqual(file_hdl.file_content, json_)
+
+
+    def test_yaml_python_tags(self):
+        with FileHandler(self.tuple_yaml_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            # Tuples are written with a `!!python/tuple` tag, which should be read back
+            yaml_ = {"test": (1, 2)}
+            file_hdl.write_to_file(yaml_)
+            self.assertEqual(file_hdl.file_content, yaml_)
+
+
+    def test_large_csv(self):
+        with FileHandler(self.large_csv_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            # More than `BUFFER_SIZE` bytes and `CSV_BATCH_ROWS` rows, 
+            # so the rows are formatted and written to the file in several batches
+            csv_ = [[str(i), "value" * 10] for i in range(30000)]
+            file_hdl.write_to_file(csv_, 'w')
+            self.assertEqual(file_hdl.file_content, csv_)
+            self.assertGreater(file_hdl.file_size, FileHandler.BUFFER_SIZE)
+
+
+    def test_csv_embedded_newlines(self):
+        with FileHandler(self.newlines_csv_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            # Newlines in quoted fields should not be translated, or split the row
+            csv_ = [
+                ["test", "line 1\nline 2"],
+                ["check", "line 1\r\nline 2"],
+            ]
+            file_hdl.write_to_file(csv_, 'w')
+            self.assertEqual(file_hdl.file_content, csv_)
+            self.assertEqual(list(file_hdl.iter_csv()), csv_)
+
+
+    def test_yaml_non_utf8_encoding(self):
+        with FileHandler(self.utf16_yaml_path, encoding='utf-16') as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            yaml_ = {"test": "123", "check": "é€"}
+            file_hdl.write_to_file(yaml_, 'w')
+            self.assertEqual(file_hdl.file_content, yaml_)
 
 
-    def test_csv(self):
-        with FileHandler(f"{self.file_dir}/test.csv") as file_hdl:
+    def test_iter_csv(self):
+        with FileHandler(self.iter_csv_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
             csv_ = [
                 ["test", "check"],
                 ["123", "ok"],
             ]
             file_hdl.write_to_file(csv_)
-            self.assertEqual(file_hdl.file_content, csv_)
+            self.assertEqual(list(file_hdl.iter_csv()), csv_)
+            self.assertEqual(list(file_hdl.iter_csv(row_factory=tuple)), [tuple(row) for row in csv_])
+            # Errors raised by `row_factory` should not be wrapped as errors reading the file
+            with self.assertRaises(ValueError):
+                list(file_hdl.iter_csv(row_factory=lambda row: int(row[0])))
 
+        file_hdl = self._get_shared_handler()
+        with self.assertRaises(FileError):
+            file_hdl.iter_csv()
 
-    def test_yaml(self):
-        with FileHandler(f"{self.file_dir}/test.yml") as file_hdl:
-            yaml_ = {
-                "test": "123",
-                "check": "ok",
-            }
-            file_hdl.write_to_file(yaml_)
-            self.assertEqual(file_hdl.file_content, yaml_)
 
+    def test_pickle_out_of_band_buffers(self):
+        with FileHandler(self.buffers_pickle_path) as file_hdl:
+            self.addCleanup(file_hdl.delete_file)
+            data = bytearray(b"test" * 1024)
+            buffers = []
+            file_hdl.write_to_file(pickle.PickleBuffer(data), buffer_callback=buffers.append)
+            self.assertEqual(len(buffers), 1)
+            self.assertEqual(file_hdl.read_file('rb', buffers=buffers), data)
 
-    def test_pickle(self):
-        with FileHandler(f"{self.file_dir}/test.pickle") as file_hdl:
-            pickle_ = {
-                "test": 123,
-                "check": "ok",
-            }
-            file_hdl.write_to_file(pickle_)
-            self.assertEqual(file_hdl.file_content, pickle_)
 
+# Generate a separate test for each file mode, so that the modes are tested 
+# independently and can be distributed across workers by parallel test runners
 
-    def test_toml(self):
-        with FileHandler(f"{self.file_dir}/test.toml") as file_hdl:
-            toml_ = {
-                "test": "123",
-                "check": "ok",
-            }
-            file_hdl.write_to_file(toml_)
-            self.assertEqual(file_hdl.file_content, toml_)
+def _mode_test_name(prefix: str, mode: str) -> str:
+    return f"test_{prefix}_{mode.replace('+', '_plus')}"
+
+
+def _make_read_mode_test(mode: str):
+    content_type = bytes if 'b' in mode else str
+
+    def test(self):
+        file_hdl = self._get_shared_handler()
+        content = file_hdl.read_file(mode)
+        # The file may be kept open in a compatible mode it was already in (e.g 'a+' for 'r'),
+        # so check that it can be read from, rather than for the exact mode
+        self.assertTrue(file_hdl.file.readable())
+        self.assertIsInstance(content, content_type)
+    return test
+
+
+def _make_write_mode_test(mode: str):
+    def test(self):
+        content = b"test" if 'b' in mode else "test"
+        file_hdl = self._get_shared_handler()
+        file_hdl.write_to_file(content, mode)
+        # The file may be kept open in a compatible mode it was already in (e.g 'a+' for 'a'),
+        # so check that it can be written to, rather than for the exact mode
+        self.assertTrue(file_hdl.file.writable())
+        if 'a' in mode:
+            self.assertIn('a', file_hdl.file_mode)
+        if 'w' in mode:
+            # `file_content` is always read in text mode
+            self.assertEqual(file_hdl.file_content, "test")
+    return test
+
+
+def _make_forbidden_mode_test(mode: str):
+    def test(self):
+        file_hdl = self._get_shared_handler()
+        with self.assertRaises(FileError):
+            file_hdl.read_file(mode)
+        with self.assertRaises(FileError):
+            file_hdl.write_to_file("test", mode)
+    return test
+
+
+for _mode in (*FileHandlerTestCase.read_modes, *FileHandlerTestCase.read_bytes_modes):
+    setattr(FileHandlerTestCase, _mode_test_name("read_mode", _mode), _make_read_mode_test(_mode))
+
+for _mode in (*FileHandlerTestCase.write_modes, *FileHandlerTestCase.write_bytes_modes):
+    setattr(FileHandlerTestCase, _mode_test_name("write_mode", _mode), _make_write_mode_test(_mode))
 
+for _mode in FileHandlerTestCase.forbidden_modes:
+    setattr(FileHandlerTestCase, _mode_test_name("forbidden_mode", _mode), _make_forbidden_mode_test(_mode))
 
-    def test_html(self):
-        with FileHandler(f"{self.file_dir}/test.html") as file_hdl:
-            html_ = "<html><body><h1>Test</h1></body></html>"
-            file_hdl.write_to_file(html_)
-            self.assertEqual(file_hdl.file_content, html_)
+del _mode
 
 
 